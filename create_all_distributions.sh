@@ -118,8 +118,9 @@ After creating rooms, the tool will automatically add a `DEC` column with the De
 ## Rate Limiting
 
 The tool automatically handles API rate limiting:
-- Limits requests to 10 per second (safely below the API limit of 15/second)
-- Automatically retries if rate limits are exceeded
+- Limits requests to 12 per second with short bursts (safely below the API limit of 15/second)
+- Creates up to 10 rooms concurrently to make the most of the allowed rate
+- Automatically retries if rate limits are exceeded, waiting as long as the API asks (Retry-After)
 - Shows progress indicators for bulk operations
 
 ## System Requirements
@@ -197,7 +198,7 @@ pip install -r requirements.txt
 
 Or install individually:
 ```bash
-pip install requests python-dotenv tabulate
+pip install requests aiohttp orjson python-dotenv tabulate
 ```
 
 ### 3. Set Up Configuration
@@ -255,8 +256,9 @@ After creating rooms, the tool will automatically add a `DEC` column with the De
 ## Rate Limiting
 
 The tool automatically handles API rate limiting:
-- Limits requests to 10 per second (safely below the API limit of 15/second)
-- Automatically retries if rate limits are exceeded
+- Limits requests to 12 per second with short bursts (safely below the API limit of 15/second)
+- Creates up to 10 rooms concurrently to make the most of the allowed rate
+- Automatically retries if rate limits are exceeded, waiting as long as the API asks (Retry-After)
 - Shows progress indicators for bulk operations
 
 ## System Requirements
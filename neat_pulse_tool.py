@@ -8,55 +8,327 @@ import os
 import sys
 import csv
 import time
+import shutil
+import sqlite3
+import asyncio
+import hashlib
+import argparse
+import tempfile
+import functools
+import traceback
+from operator import itemgetter
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
+import aiohttp
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 from tabulate import tabulate
 
 
 BASE_URL = "https://api.pulse.neat.no"
 
+# Shared session so every call to the Pulse API reuses the same keep-alive
+# TCP/TLS connection instead of performing a new handshake per request.
+# The adapter never retries on its own; errors are reported to the user.
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=0))
+
+# Persistent cache of room creation responses, so re-running a CSV after a
+# partial failure doesn't re-create rooms that already exist
+CACHE_FILENAME = ".neat_pulse_cache.sqlite"
+CACHE_TTL_SECONDS = 7 * 24 * 60 * 60  # 7 days
+CACHE_COMMIT_EVERY = 25  # writes per transaction
+
+# Error messages for HTTP status codes common to all API calls. Messages may
+# use {status} and {text} placeholders for the status code and response body.
+_STATUS_MSGS: Dict[int, str] = {
+    401: "Error: Unauthorized. Please check your bearer token.",
+    404: "Error: Organization not found. Please check your organization ID.",
+}
+
+# requests exception classes, looked up once rather than on every except
+_Timeout = requests.exceptions.Timeout
+_ConnectionError = requests.exceptions.ConnectionError
+_HTTPError = requests.exceptions.HTTPError
+
+# In-memory cache of list responses: url -> (fetch time, parsed JSON)
+LIST_CACHE_TTL_SECONDS = 60
+_list_cache: Dict[str, Tuple[float, object]] = {}
+
 
 class RateLimiter:
     """
-    Rate limiter to prevent exceeding API rate limits.
+    Token bucket rate limiter to prevent exceeding API rate limits.
     
     The Pulse API has a rate limit of 15 requests/second per integration token.
-    This class enforces a configurable rate (default: 10 req/s) to stay safely
-    below the limit.
+    The bucket holds up to `capacity` tokens and refills at `refill_rate`
+    tokens per second; each request consumes one token. This allows short
+    bursts while smoothing to the steady rate. The defaults (burst of 3,
+    12 req/s) never allow more than 15 requests in any one-second window.
     """
     
-    def __init__(self, requests_per_second: float = 10.0):
+    def __init__(self, capacity: int = 3, refill_rate: float = 12.0):
         """
         Initialize the rate limiter.
         
         Args:
-            requests_per_second: Maximum number of requests per second (default: 10)
+            capacity: Maximum number of tokens (burst size) (default: 3)
+            refill_rate: Tokens added per second (default: 12)
         """
-        self.requests_per_second = requests_per_second
-        self.min_interval = 1.0 / requests_per_second  # Minimum seconds between requests
-        self.last_request_time = 0.0
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens: float = float(capacity)
+        self.last_refill = time.monotonic()
+        self.blocked_until = 0.0  # time.monotonic() before which no request may be sent
     
-    def wait_if_needed(self) -> None:
+    def _reserve(self, n: int) -> float:
         """
-        Wait if necessary to maintain the rate limit.
-        This should be called before making each API request.
+        Refill the bucket and take `n` tokens from it.
+
+        The token count may go negative, which reserves future tokens for
+        the caller; concurrent callers therefore queue up behind each other.
+
+        Returns:
+            Number of seconds the caller must wait before making its request
         """
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
-        
-        if time_since_last_request < self.min_interval:
-            sleep_time = self.min_interval - time_since_last_request
-            time.sleep(sleep_time)
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
+        self.tokens -= n
+
+        if self.tokens < 0:
+            return -self.tokens / self.refill_rate
+        return 0.0
     
-    def record_request(self) -> None:
+    def _blocked_for(self) -> float:
+        """
+        Returns:
+            Seconds remaining in a window set by defer(), or 0 if not blocked
+        """
+        return max(0.0, self.blocked_until - time.monotonic())
+
+    def acquire(self, n: int = 1) -> None:
+        """
+        Wait until `n` tokens are available and consume them.
+        This should be called before making each API request.
+
+        If defer() was called while waiting, the caller waits out the
+        deferral and then takes a fresh token.
+        """
+        while True:
+            wait_time = self._reserve(n)
+            if wait_time > 0:
+                time.sleep(wait_time)
+
+            blocked_time = self._blocked_for()
+            if blocked_time <= 0:
+                return
+            time.sleep(blocked_time)
+
+    async def acquire_async(self, n: int = 1) -> None:
+        """
+        Asynchronous variant of acquire() for concurrent requests.
+        """
+        while True:
+            wait_time = self._reserve(n)
+            if wait_time > 0:
+                await asyncio.sleep(wait_time)
+
+            blocked_time = self._blocked_for()
+            if blocked_time <= 0:
+                return
+            await asyncio.sleep(blocked_time)
+
+    def defer(self, seconds: float) -> None:
+        """
+        Empty the bucket so that no tokens are available for `seconds`.
+        Used when the server reports that its quota is exhausted.
+
+        Callers already sleeping on an earlier reservation re-check the
+        deferral when they wake, so they also wait until it has passed.
+        """
+        self._reserve(0)
+        self.tokens = min(self.tokens, -seconds * self.refill_rate)
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """
+        Adjust the bucket using the server's X-RateLimit-* response headers.
+
+        If the server reports fewer remaining requests than we have tokens,
+        the bucket is reduced to match; if none remain, requests are held
+        back until X-RateLimit-Reset.
+        """
+        try:
+            remaining = float(headers.get("X-RateLimit-Remaining", ""))
+        except ValueError:
+            return
+
+        if remaining < 1:
+            reset_wait = _parse_wait_header(headers.get("X-RateLimit-Reset"))
+            self.defer(reset_wait if reset_wait is not None else 1.0 / self.refill_rate)
+        else:
+            self._reserve(0)
+            self.tokens = min(self.tokens, remaining)
+
+
+def _parse_wait_header(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a rate limit header into a number of seconds to wait.
+
+    Accepts a number of seconds, a Unix timestamp, or an HTTP-date
+    (as allowed for Retry-After).
+
+    Args:
+        value: Header value, or None if the header is absent
+
+    Returns:
+        Seconds to wait (never negative), or None if the value can't be parsed
+    """
+    if not value:
+        return None
+
+    try:
+        seconds = float(value)
+        # Large values are absolute Unix timestamps rather than a delay
+        if seconds > 1_000_000_000:
+            seconds -= time.time()
+        return max(0.0, seconds)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def _get_retry_wait(headers: Mapping[str, str], retry_count: int, base_wait_time: float) -> float:
+    """
+    Determine how long to wait before retrying a rate limited (HTTP 429) request.
+
+    Uses the server's Retry-After or X-RateLimit-Reset header when present,
+    otherwise falls back to exponential backoff.
+
+    Args:
+        headers: Response headers of the 429 response
+        retry_count: Number of retries already made
+        base_wait_time: Base wait time in seconds for exponential backoff
+
+    Returns:
+        Seconds to wait before the next attempt
+    """
+    for header in ("Retry-After", "X-RateLimit-Reset"):
+        wait_time = _parse_wait_header(headers.get(header))
+        if wait_time is not None:
+            return wait_time
+
+    return base_wait_time * (2 ** retry_count)  # Exponential backoff: 5s, 10s, 20s, 40s
+
+
+class ResponseCache:
+    """
+    SQLite-backed cache of API responses for created rooms.
+
+    Entries are keyed by organization, location and room name and expire
+    after a configurable time-to-live. Writes are committed in batches of
+    CACHE_COMMIT_EVERY; call flush() (or close()) to commit the rest.
+    """
+
+    def __init__(self, path: str = CACHE_FILENAME, ttl: float = CACHE_TTL_SECONDS):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: Path of the SQLite database file
+            ttl: Seconds after which a cached response is ignored
+        """
+        self.ttl = ttl
+        self._uncommitted = 0
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        self.conn.commit()
+
+    @staticmethod
+    def make_key(org_id: str, location_id: object, name: str, occurrence: int = 0) -> str:
+        """
+        Build the cache key for a room.
+
+        Args:
+            org_id: Organization ID
+            location_id: Location ID of the room
+            name: Name of the room
+            occurrence: Number of earlier CSV rows with the same location and
+                name, so that duplicate rows get separate entries
+
+        Returns:
+            Hex digest identifying the room
+        """
+        key = f"{org_id}|{location_id}|{name}"
+        if occurrence:
+            key += f"|{occurrence}"
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Look up a cached response.
+
+        Returns:
+            The cached API response, or None if missing or expired
+        """
+        row = self.conn.execute(
+            "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+
+        if row is None or time.time() - row[1] > self.ttl:
+            return None
+        return orjson.loads(row[0])
+
+    def set(self, key: str, response: Dict) -> None:
+        """
+        Store an API response in the cache.
+        """
+        self.conn.execute(
+            "INSERT OR REPLACE INTO responses (key, response, created_at) VALUES (?, ?, ?)",
+            (key, orjson.dumps(response).decode("utf-8"), time.time())
+        )
+        self._uncommitted += 1
+        if self._uncommitted >= CACHE_COMMIT_EVERY:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Commit any writes not yet committed.
+        """
+        if self._uncommitted:
+            self.conn.commit()
+            self._uncommitted = 0
+
+    def clear(self) -> None:
         """
-        Record that a request was made.
-        This should be called after making each API request.
+        Remove all cached responses.
         """
-        self.last_request_time = time.time()
+        self.conn.execute("DELETE FROM responses")
+        self.conn.commit()
+
+    def close(self) -> None:
+        """
+        Commit pending writes and close the database connection.
+        """
+        try:
+            self.flush()
+        finally:
+            self.conn.close()
 
 
 def load_config() -> Tuple[str, str]:
@@ -105,10 +377,157 @@ def get_headers(token: str) -> Dict[str, str]:
     """
     return {
         "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
+        "Content-Type": "application/json",
+        "Connection": "keep-alive"
     }
 
 
+def _authorize_session(token: str) -> None:
+    """
+    Make the shared session send the given bearer token.
+
+    The headers are only updated when the token differs from the one the
+    session already uses, so calling this before every API call is cheap.
+
+    Args:
+        token: Bearer token for authentication
+    """
+    headers = get_headers(token)
+    if _session.headers.get("Authorization") != headers["Authorization"]:
+        _session.headers.update(headers)
+
+
+def api_errors(
+    func: Optional[Callable] = None,
+    *,
+    status_msgs: Optional[Dict[int, str]] = None,
+    debug: bool = False
+) -> Callable:
+    """
+    Decorator that reports API errors raised by a menu action to the user.
+
+    Can be used bare (@api_errors) or with options (@api_errors(debug=True)).
+
+    Args:
+        func: Function to wrap
+        status_msgs: Extra or overriding messages per HTTP status code
+        debug: Print a traceback for unexpected errors
+
+    Returns:
+        The wrapped function, which returns None if an error occurred
+    """
+    messages = {**_STATUS_MSGS, **(status_msgs or {})}
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return func(*args, **kwargs)
+            except _Timeout:
+                print("Error: Request timed out. Please check your network connection.")
+            except _ConnectionError:
+                print("Error: Could not connect to the Neat Pulse API. Please check your network.")
+            except _HTTPError as e:
+                status = e.response.status_code
+                message = messages.get(status, "Error: HTTP {status} - {text}")
+                print(message.format(status=status, text=e.response.text))
+            except Exception as e:
+                print(f"Error: An unexpected error occurred: {e}")
+                if debug:
+                    print(f"Error type: {type(e).__name__}")
+                    print("\nDebug information:")
+                    traceback.print_exc()
+            return None
+
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
+
+
+def _post(url: str, payload: Dict) -> requests.Response:
+    """
+    POST a JSON payload through the shared session.
+
+    The payload is serialized with orjson; the session already sends the
+    JSON Content-Type header.
+
+    Args:
+        url: URL to post to
+        payload: JSON-serializable request body
+
+    Returns:
+        The HTTP response
+
+    Raises:
+        requests.exceptions.HTTPError: If the API returns an error status
+        requests.exceptions.RequestException: If the request fails
+    """
+    response = _session.post(url, data=orjson.dumps(payload), timeout=30)
+    response.raise_for_status()
+    return response
+
+
+def _parse_json(response: requests.Response) -> object:
+    """
+    Parse a response body as JSON using orjson.
+
+    Args:
+        response: HTTP response
+
+    Returns:
+        Parsed JSON body
+    """
+    return orjson.loads(response.content)
+
+
+def _get_json_cached(url: str) -> object:
+    """
+    GET a URL and return the parsed JSON body.
+
+    Responses are reused for LIST_CACHE_TTL_SECONDS so that repeatedly
+    listing from the menu doesn't re-fetch the same data.
+
+    Args:
+        url: URL to fetch
+
+    Returns:
+        Parsed JSON response
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails
+    """
+    cached = _list_cache.get(url)
+    if cached and time.monotonic() - cached[0] < LIST_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    response = _session.get(url, timeout=30)
+    response.raise_for_status()
+
+    data = _parse_json(response)
+    _list_cache[url] = (time.monotonic(), data)
+    return data
+
+
+def _id_sort_key(raw_id: object) -> int:
+    """
+    Convert an API object ID into an integer sort key.
+
+    Args:
+        raw_id: ID as returned by the API (int or numeric string)
+
+    Returns:
+        The numeric ID, or 0 if the ID is not numeric
+    """
+    if isinstance(raw_id, int):
+        return raw_id
+    if isinstance(raw_id, str) and raw_id.isdigit():
+        return int(raw_id)
+    return 0
+
+
+@api_errors(debug=True)
 def list_locations(org_id: str, token: str) -> None:
     """
     List all locations in the Neat Pulse tenant.
@@ -118,99 +537,81 @@ def list_locations(org_id: str, token: str) -> None:
         token: Bearer token for authentication
     """
     url = f"{BASE_URL}/v1/orgs/{org_id}/locations"
-    headers = get_headers(token)
+    _authorize_session(token)
 
     print("\nFetching locations...")
 
-    try:
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-
-        data = response.json()
-
-        # Handle different response structures
-        # The API might return locations directly or wrapped in an object
-        if isinstance(data, dict):
-            # Check if locations are in a 'locations' key
-            if 'locations' in data:
-                locations = data['locations']
-            elif 'data' in data:
-                locations = data['data']
-            else:
-                # Treat the dict itself as a single location
-                locations = [data]
-        elif isinstance(data, list):
-            locations = data
+    data = _get_json_cached(url)
+
+    # Handle different response structures
+    # The API might return locations directly or wrapped in an object
+    if isinstance(data, dict):
+        # Check if locations are in a 'locations' key
+        if 'locations' in data:
+            locations = data['locations']
+        elif 'data' in data:
+            locations = data['data']
         else:
-            print(f"\nError: Unexpected response format. Response type: {type(data)}")
-            print(f"Response content: {data}")
-            return
+            # Treat the dict itself as a single location
+            locations = [data]
+    elif isinstance(data, list):
+        locations = data
+    else:
+        print(f"\nError: Unexpected response format. Response type: {type(data)}")
+        print(f"Response content: {data}")
+        return
 
-        if not locations:
-            print("\nNo locations found.")
-            return
+    if not locations:
+        print("\nNo locations found.")
+        return
 
-        # Prepare data for table display
-        table_data = []
-        for loc in locations:
-            if isinstance(loc, dict):
-                # Get region information - could be regionId, region.id, or region.name
-                region_info = "N/A"
-                if "regionId" in loc:
-                    region_info = loc.get("regionId", "N/A")
-                elif "region" in loc:
-                    region = loc.get("region")
-                    if isinstance(region, dict):
-                        # If region is an object, try to get name first, then id
-                        region_info = region.get("name", region.get("id", "N/A"))
-                    else:
-                        region_info = str(region)
-
-                table_data.append([
-                    loc.get("id", "N/A"),
-                    loc.get("name", "N/A"),
-                    region_info
-                ])
-            else:
-                print(f"\nWarning: Unexpected location format: {loc}")
+    # Prepare data for table display
+    table_data = []
+    for loc in locations:
+        if isinstance(loc, dict):
+            # Get region information - could be regionId, region.id, or region.name
+            region_info = "N/A"
+            if "regionId" in loc:
+                region_info = loc.get("regionId", "N/A")
+            elif "region" in loc:
+                region = loc.get("region")
+                if isinstance(region, dict):
+                    # If region is an object, try to get name first, then id
+                    region_info = region.get("name", region.get("id", "N/A"))
+                else:
+                    region_info = str(region)
+
+            location_id = loc.get("id", "N/A")
+            table_data.append([
+                location_id,
+                loc.get("name", "N/A"),
+                region_info,
+                _id_sort_key(location_id)  # Sort key, removed before display
+            ])
+        else:
+            print(f"\nWarning: Unexpected location format: {loc}")
 
-        if not table_data:
-            print("\nNo valid location data found.")
-            return
+    if not table_data:
+        print("\nNo valid location data found.")
+        return
 
-        # Sort by ID (ascending order)
-        table_data.sort(key=lambda x: int(x[0]) if str(x[0]).isdigit() else 0)
-
-        # Display as formatted table
-        print("\n" + "="*80)
-        print("LOCATIONS")
-        print("="*80)
-        print(tabulate(
-            table_data,
-            headers=["ID", "Name", "Region"],
-            tablefmt="grid"
-        ))
-        print(f"\nTotal locations: {len(table_data)}")
-
-    except requests.exceptions.Timeout:
-        print("Error: Request timed out. Please check your network connection.")
-    except requests.exceptions.ConnectionError:
-        print("Error: Could not connect to the Neat Pulse API. Please check your network.")
-    except requests.exceptions.HTTPError as e:
-        if e.response.status_code == 401:
-            print("Error: Unauthorized. Please check your bearer token.")
-        elif e.response.status_code == 404:
-            print("Error: Organization not found. Please check your organization ID.")
-        else:
-            print(f"Error: HTTP {e.response.status_code} - {e.response.text}")
-    except Exception as e:
-        print(f"Error: An unexpected error occurred: {e}")
-        print(f"Error type: {type(e).__name__}")
-        import traceback
-        print("\nDebug information:")
-        traceback.print_exc()
+    # Sort by ID (ascending order) using the precomputed key, then drop it
+    table_data.sort(key=itemgetter(-1))
+    table_data = [row[:-1] for row in table_data]
+
+    # Display as formatted table
+    print("\n" + "="*80)
+    print("LOCATIONS")
+    print("="*80)
+    print(tabulate(
+        table_data,
+        headers=["ID", "Name", "Region"],
+        tablefmt="grid"
+    ))
+    print(f"\nTotal locations: {len(table_data)}")
 
 
+@api_errors(debug=True)
 def list_regions(org_id: str, token: str) -> None:
     """
     List all regions in the Neat Pulse tenant.
@@ -220,83 +621,65 @@ def list_regions(org_id: str, token: str) -> None:
         token: Bearer token for authentication
     """
     url = f"{BASE_URL}/v1/orgs/{org_id}/regions"
-    headers = get_headers(token)
+    _authorize_session(token)
 
     print("\nFetching regions...")
 
-    try:
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-
-        data = response.json()
+    data = _get_json_cached(url)
 
-        # Handle different response structures
-        if isinstance(data, dict):
-            if 'regions' in data:
-                regions = data['regions']
-            elif 'data' in data:
-                regions = data['data']
-            else:
-                regions = [data]
-        elif isinstance(data, list):
-            regions = data
+    # Handle different response structures
+    if isinstance(data, dict):
+        if 'regions' in data:
+            regions = data['regions']
+        elif 'data' in data:
+            regions = data['data']
         else:
-            print(f"\nError: Unexpected response format. Response type: {type(data)}")
-            print(f"Response content: {data}")
-            return
+            regions = [data]
+    elif isinstance(data, list):
+        regions = data
+    else:
+        print(f"\nError: Unexpected response format. Response type: {type(data)}")
+        print(f"Response content: {data}")
+        return
 
-        if not regions:
-            print("\nNo regions found.")
-            return
+    if not regions:
+        print("\nNo regions found.")
+        return
 
-        # Prepare data for table display
-        table_data = []
-        for region in regions:
-            if isinstance(region, dict):
-                table_data.append([
-                    region.get("id", "N/A"),
-                    region.get("name", "N/A")
-                ])
-            else:
-                print(f"\nWarning: Unexpected region format: {region}")
+    # Prepare data for table display
+    table_data = []
+    for region in regions:
+        if isinstance(region, dict):
+            region_id = region.get("id", "N/A")
+            table_data.append([
+                region_id,
+                region.get("name", "N/A"),
+                _id_sort_key(region_id)  # Sort key, removed before display
+            ])
+        else:
+            print(f"\nWarning: Unexpected region format: {region}")
 
-        if not table_data:
-            print("\nNo valid region data found.")
-            return
+    if not table_data:
+        print("\nNo valid region data found.")
+        return
 
-        # Sort by ID (ascending order)
-        table_data.sort(key=lambda x: int(x[0]) if str(x[0]).isdigit() else 0)
-
-        # Display as formatted table
-        print("\n" + "="*80)
-        print("REGIONS")
-        print("="*80)
-        print(tabulate(
-            table_data,
-            headers=["ID", "Name"],
-            tablefmt="grid"
-        ))
-        print(f"\nTotal regions: {len(table_data)}")
-
-    except requests.exceptions.Timeout:
-        print("Error: Request timed out. Please check your network connection.")
-    except requests.exceptions.ConnectionError:
-        print("Error: Could not connect to the Neat Pulse API. Please check your network.")
-    except requests.exceptions.HTTPError as e:
-        if e.response.status_code == 401:
-            print("Error: Unauthorized. Please check your bearer token.")
-        elif e.response.status_code == 404:
-            print("Error: Organization not found. Please check your organization ID.")
-        else:
-            print(f"Error: HTTP {e.response.status_code} - {e.response.text}")
-    except Exception as e:
-        print(f"Error: An unexpected error occurred: {e}")
-        print(f"Error type: {type(e).__name__}")
-        import traceback
-        print("\nDebug information:")
-        traceback.print_exc()
+    # Sort by ID (ascending order) using the precomputed key, then drop it
+    table_data.sort(key=itemgetter(-1))
+    table_data = [row[:-1] for row in table_data]
 
+    # Display as formatted table
+    print("\n" + "="*80)
+    print("REGIONS")
+    print("="*80)
+    print(tabulate(
+        table_data,
+        headers=["ID", "Name"],
+        tablefmt="grid"
+    ))
+    print(f"\nTotal regions: {len(table_data)}")
 
+
+@api_errors
 def create_region(org_id: str, token: str) -> None:
     """
     Create a new region in the Neat Pulse tenant.
@@ -316,37 +699,27 @@ def create_region(org_id: str, token: str) -> None:
         return
 
     url = f"{BASE_URL}/v1/orgs/{org_id}/regions"
-    headers = get_headers(token)
+    _authorize_session(token)
     payload = {"name": region_name}
 
     print(f"\nCreating region '{region_name}'...")
 
-    try:
-        response = requests.post(url, headers=headers, json=payload, timeout=30)
-        response.raise_for_status()
-
-        result = response.json()
-        region_id = result.get("id", "N/A")
-
-        print(f"\n✓ Success! Region created:")
-        print(f"  - Region ID: {region_id}")
-        print(f"  - Name: {region_name}")
-
-    except requests.exceptions.Timeout:
-        print("Error: Request timed out. Please check your network connection.")
-    except requests.exceptions.ConnectionError:
-        print("Error: Could not connect to the Neat Pulse API. Please check your network.")
-    except requests.exceptions.HTTPError as e:
-        if e.response.status_code == 401:
-            print("Error: Unauthorized. Please check your bearer token.")
-        elif e.response.status_code == 404:
-            print("Error: Organization not found. Please check your organization ID.")
-        else:
-            print(f"Error: HTTP {e.response.status_code} - {e.response.text}")
-    except Exception as e:
-        print(f"Error: An unexpected error occurred: {e}")
+    response = _post(url, payload)
 
+    result = _parse_json(response)
+    region_id = result.get("id", "N/A")
 
+    # The cached region list is now out of date
+    _list_cache.pop(url, None)
+
+    print(f"\n✓ Success! Region created:")
+    print(f"  - Region ID: {region_id}")
+    print(f"  - Name: {region_name}")
+
+
+@api_errors(status_msgs={
+    400: "Error: Bad request - {text}\nPlease verify the region ID is correct."
+})
 def create_location(org_id: str, token: str) -> None:
     """
     Create a new location in the Neat Pulse tenant.
@@ -379,7 +752,7 @@ def create_location(org_id: str, token: str) -> None:
         return
 
     url = f"{BASE_URL}/v1/orgs/{org_id}/locations"
-    headers = get_headers(token)
+    _authorize_session(token)
     payload = {
         "name": location_name,
         "regionId": region_id
@@ -387,37 +760,21 @@ def create_location(org_id: str, token: str) -> None:
 
     print(f"\nCreating location '{location_name}' in region '{region_id}'...")
 
-    try:
-        response = requests.post(url, headers=headers, json=payload, timeout=30)
-        response.raise_for_status()
-
-        result = response.json()
-        location_id = result.get("id", "N/A")
-
-        print(f"\n✓ Success! Location created:")
-        print(f"  - Location ID: {location_id}")
-        print(f"  - Name: {location_name}")
-        print(f"  - Region ID: {region_id}")
-
-    except requests.exceptions.Timeout:
-        print("Error: Request timed out. Please check your network connection.")
-    except requests.exceptions.ConnectionError:
-        print("Error: Could not connect to the Neat Pulse API. Please check your network.")
-    except requests.exceptions.HTTPError as e:
-        if e.response.status_code == 401:
-            print("Error: Unauthorized. Please check your bearer token.")
-        elif e.response.status_code == 404:
-            print("Error: Organization not found. Please check your organization ID.")
-        elif e.response.status_code == 400:
-            print(f"Error: Bad request - {e.response.text}")
-            print("Please verify the region ID is correct.")
-        else:
-            print(f"Error: HTTP {e.response.status_code} - {e.response.text}")
-    except Exception as e:
-        print(f"Error: An unexpected error occurred: {e}")
+    response = _post(url, payload)
+
+    result = _parse_json(response)
+    location_id = result.get("id", "N/A")
+
+    # The cached location list is now out of date
+    _list_cache.pop(url, None)
 
+    print(f"\n✓ Success! Location created:")
+    print(f"  - Location ID: {location_id}")
+    print(f"  - Name: {location_name}")
+    print(f"  - Region ID: {region_id}")
 
-def read_csv_file(csv_filename: str) -> Optional[List[Dict[str, str]]]:
+
+def read_csv_file(csv_filename: str) -> Optional[Tuple[List[str], List[Dict[str, str]]]]:
     """
     Read CSV file and validate required columns.
 
@@ -425,7 +782,7 @@ def read_csv_file(csv_filename: str) -> Optional[List[Dict[str, str]]]:
         csv_filename: Name of the CSV file
 
     Returns:
-        List of dictionaries with room data, or None if error
+        Tuple of (fieldnames, list of dictionaries with room data), or None if error
     """
     csv_path = Path(csv_filename)
 
@@ -456,279 +813,418 @@ def read_csv_file(csv_filename: str) -> Optional[List[Dict[str, str]]]:
                 print("Error: CSV file contains no data rows.")
                 return None
 
-            return rooms
+            return list(reader.fieldnames), rooms
 
     except Exception as e:
         print(f"Error reading CSV file: {e}")
         return None
 
 
-def create_room(org_id: str, token: str, location_id: str, name: str) -> Optional[Dict]:
+async def _create_room_async(
+    session: aiohttp.ClientSession,
+    org_id: str,
+    location_id: int,
+    name: str,
+    sem: asyncio.Semaphore,
+    limiter: Optional[RateLimiter] = None,
+    max_retries: int = 3,
+    cache: Optional[ResponseCache] = None,
+    cache_key: Optional[str] = None,
+    log: Callable[[str], None] = print
+) -> Optional[Dict]:
     """
-    Create a single room via the Neat Pulse API.
+    Create a room asynchronously with automatic retry logic for rate limit errors.
+
+    This adds, on top of a plain POST to the rooms endpoint:
+    - Cached responses for rooms created by earlier runs
+    - Rate limiting to prevent hitting API limits
+    - Automatic retry for HTTP 429 errors, waiting as long as the server's
+      Retry-After header asks (exponential backoff if it is absent)
+
+    The semaphore bounds the number of in-flight requests and the rate
+    limiter keeps the overall request rate below the API limit.
 
     Args:
+        session: aiohttp session used for the request
         org_id: Organization ID
-        token: Bearer token
-        location_id: Location ID for the room (will be converted to integer)
+        location_id: Numeric location ID for the room
         name: Name of the room
+        sem: Semaphore limiting the number of concurrent requests
+        limiter: Optional RateLimiter instance to enforce rate limits
+        max_retries: Maximum number of retry attempts for rate limit errors (default: 3)
+        cache: Optional ResponseCache in which to store the created room
+        cache_key: Key under which to store the room (see ResponseCache.make_key)
+        log: Function used to report errors and retries (default: print)
 
     Returns:
         API response dictionary if successful, None otherwise
     """
     url = f"{BASE_URL}/v1/orgs/{org_id}/rooms"
-    headers = get_headers(token)
-
-    # Convert location_id to integer as required by the API
-    try:
-        location_id_int = int(location_id)
-    except (ValueError, TypeError):
-        print(f"  Failed: Invalid location ID '{location_id}' - must be a number")
-        return None
-
     payload = {
-        "locationId": location_id_int,
+        "locationId": location_id,
         "name": name
     }
 
-    try:
-        response = requests.post(url, headers=headers, json=payload, timeout=30)
-        response.raise_for_status()
-        return response.json()
+    retry_count = 0
+    base_wait_time = 5  # Start with 5 seconds
 
-    except requests.exceptions.HTTPError as e:
-        error_msg = f"  Failed: HTTP {e.response.status_code} - {e.response.text}"
-        print(error_msg)
+    async with sem:
+        while retry_count <= max_retries:
+            # Apply rate limiting before making the request
+            if limiter:
+                await limiter.acquire_async()
 
-        # Provide helpful hints for common errors
-        if e.response.status_code == 400:
             try:
-                error_data = e.response.json()
-                if "preconditions not met" in error_data.get("message", "").lower():
-                    print(f"  Hint: Location ID {location_id_int} may not exist. Use option 3 to verify location IDs.")
-            except:
-                pass
+                async with session.post(url, data=orjson.dumps(payload)) as response:
+                    # Handle rate limit errors (HTTP 429), honouring the server's Retry-After
+                    if response.status == 429:
+                        if retry_count < max_retries:
+                            wait_time = _get_retry_wait(response.headers, retry_count, base_wait_time)
+                            log(f"  Rate limit exceeded (429) for '{name}'. Waiting {wait_time:.1f}s before retry {retry_count + 1}/{max_retries}...")
+                            # Hold back the other concurrent requests as well
+                            if limiter:
+                                limiter.defer(wait_time)
+                            await asyncio.sleep(wait_time)
+                            retry_count += 1
+                            continue  # Retry the request
+
+                        log(f"  Failed ({name}): Rate limit exceeded after {max_retries} retries")
+                        return None
+
+                    # Handle other HTTP errors
+                    if response.status >= 400:
+                        error_text = await response.text()
+                        log(f"  Failed ({name}): HTTP {response.status} - {error_text}")
+
+                        # Provide helpful hints for common errors
+                        if response.status == 400:
+                            try:
+                                error_data = orjson.loads(await response.read())
+                                if "preconditions not met" in error_data.get("message", "").lower():
+                                    log(f"  Hint: Location ID {location_id} may not exist. Use option 3 to verify location IDs.")
+                            except Exception:
+                                pass
+
+                        return None
+
+                    # Slow down before hitting the limit if the server says we're close
+                    if limiter:
+                        limiter.update_from_headers(response.headers)
+
+                    result = orjson.loads(await response.read())
+
+            except Exception as e:
+                log(f"  Failed ({name}): {e}")
+                return None
 
-        return None
-    except Exception as e:
-        print(f"  Failed: {e}")
-        return None
+            # The room now exists, so a cache problem must not turn it into a failure
+            if cache and cache_key:
+                try:
+                    cache.set(cache_key, result)
+                except sqlite3.Error as e:
+                    log(f"  Warning ({name}): Could not save room to the response cache: {e}")
+            return result
+
+    return None
 
 
-def create_room_with_retry(
-    org_id: str, 
-    token: str, 
-    location_id: str, 
-    name: str,
-    rate_limiter: Optional[RateLimiter] = None,
-    max_retries: int = 3
-) -> Optional[Dict]:
+class ProgressLine:
     """
-    Create a room with automatic retry logic for rate limit errors.
-    
-    This function wraps create_room() and adds:
-    - Rate limiting to prevent hitting API limits
-    - Automatic retry with exponential backoff for HTTP 429 errors
-    - Enhanced error messages
-    
+    Single progress line that is rewritten in place.
+
+    Redrawing is throttled to roughly 200 updates per run, so large CSVs
+    don't flood the terminal. Other messages can be printed through
+    message(), which keeps the progress line below them.
+    """
+
+    def __init__(self, total: int, completed: int = 0):
+        """
+        Initialize the progress line.
+
+        Args:
+            total: Total number of rooms in the CSV
+            completed: Number of rooms already processed before starting
+        """
+        self.total = total
+        self.completed = completed
+        self.initial_completed = completed
+        self.start_time = time.time()
+        self.update_every = max(1, total // 200)
+        self.line_width = 0
+
+    def advance(self) -> None:
+        """
+        Record one more processed room and redraw if due.
+        """
+        self.completed += 1
+        if self.completed % self.update_every == 0 or self.completed == self.total:
+            self.render()
+
+    def message(self, text: str) -> None:
+        """
+        Print a message above the progress line.
+        """
+        sys.stdout.write("\r" + " " * self.line_width + "\r")
+        print(text)
+        self.render()
+
+    def render(self) -> None:
+        """
+        Redraw the progress line with elapsed time and ETA.
+        """
+        elapsed_time = time.time() - self.start_time
+
+        # Calculate rate and ETA from the rooms processed during this run only
+        processed_this_run = self.completed - self.initial_completed
+        if elapsed_time > 0 and processed_this_run > 0:
+            eta_seconds = (self.total - self.completed) * elapsed_time / processed_this_run
+            eta_minutes = int(eta_seconds // 60)
+            eta_secs = int(eta_seconds % 60)
+
+            # Format ETA
+            if eta_minutes > 0:
+                eta_str = f"{eta_minutes}m {eta_secs}s"
+            else:
+                eta_str = f"{eta_secs}s"
+        else:
+            eta_str = "calculating..."
+
+        # Calculate percentage
+        percentage = (self.completed / self.total) * 100
+
+        line = (f"  Progress: {self.completed}/{self.total} ({percentage:.1f}%) | "
+                f"Elapsed: {int(elapsed_time)}s | "
+                f"ETA: {eta_str}")
+        sys.stdout.write("\r" + line.ljust(self.line_width))
+        sys.stdout.flush()
+        self.line_width = len(line)
+
+    def finish(self) -> None:
+        """
+        Draw the final state and end the progress line.
+        """
+        self.render()
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+
+
+async def _create_rooms_async(
+    org_id: str,
+    token: str,
+    pending_rooms: List[Tuple[int, int, str, str]],
+    total_rooms: int,
+    cache: Optional[ResponseCache] = None
+) -> List[Optional[Dict]]:
+    """
+    Create rooms concurrently over a shared aiohttp session.
+
     Args:
         org_id: Organization ID
         token: Bearer token
-        location_id: Location ID for the room
-        name: Name of the room
-        rate_limiter: Optional RateLimiter instance to enforce rate limits
-        max_retries: Maximum number of retry attempts for rate limit errors (default: 3)
-    
+        pending_rooms: List of (row index, location ID, name, cache key) for rooms to create
+        total_rooms: Total number of rows in the CSV (for progress display)
+        cache: Optional ResponseCache in which to store created rooms
+
     Returns:
-        API response dictionary if successful, None otherwise
+        List of API responses (or None for failures) in the same order as pending_rooms
     """
-    retry_count = 0
-    base_wait_time = 5  # Start with 5 seconds
-    
-    while retry_count <= max_retries:
-        # Apply rate limiting before making the request
-        if rate_limiter:
-            rate_limiter.wait_if_needed()
-        
-        # Attempt to create the room
-        url = f"{BASE_URL}/v1/orgs/{org_id}/rooms"
-        headers = get_headers(token)
-        
-        # Convert location_id to integer as required by the API
-        try:
-            location_id_int = int(location_id)
-        except (ValueError, TypeError):
-            print(f"  Failed: Invalid location ID '{location_id}' - must be a number")
-            return None
-        
-        payload = {
-            "locationId": location_id_int,
-            "name": name
-        }
-        
-        try:
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
-            
-            # Record the request for rate limiting
-            if rate_limiter:
-                rate_limiter.record_request()
-            
-            response.raise_for_status()
-            return response.json()
-        
-        except requests.exceptions.HTTPError as e:
-            # Record the request even if it failed
-            if rate_limiter:
-                rate_limiter.record_request()
-            
-            # Handle rate limit errors (HTTP 429) with exponential backoff
-            if e.response.status_code == 429:
-                if retry_count < max_retries:
-                    wait_time = base_wait_time * (2 ** retry_count)  # Exponential backoff: 5s, 10s, 20s, 40s
-                    print(f"  Rate limit exceeded (429). Waiting {wait_time}s before retry {retry_count + 1}/{max_retries}...")
-                    time.sleep(wait_time)
-                    retry_count += 1
-                    continue  # Retry the request
-                else:
-                    print(f"  Failed: Rate limit exceeded after {max_retries} retries")
-                    return None
-            
-            # Handle other HTTP errors
-            error_msg = f"  Failed: HTTP {e.response.status_code} - {e.response.text}"
-            print(error_msg)
-            
-            # Provide helpful hints for common errors
-            if e.response.status_code == 400:
-                try:
-                    error_data = e.response.json()
-                    if "preconditions not met" in error_data.get("message", "").lower():
-                        print(f"  Hint: Location ID {location_id_int} may not exist. Use option 3 to verify location IDs.")
-                except:
-                    pass
-            
-            return None
-        
-        except Exception as e:
-            # Record the request even if it failed
-            if rate_limiter:
-                rate_limiter.record_request()
-            
-            print(f"  Failed: {e}")
-            return None
-    
-    return None
+    # Semaphore caps in-flight requests; the token bucket caps requests/second
+    # (12 req/s with bursts of 3, safely below the 15 req/s limit)
+    sem = asyncio.Semaphore(10)
+    limiter = RateLimiter()
+
+    progress = ProgressLine(total_rooms, completed=total_rooms - len(pending_rooms))
+    progress.render()
+
+    async def create_one(idx: int, location_id: int, name: str, cache_key: str) -> Optional[Dict]:
+        response = await _create_room_async(
+            session, org_id, location_id, name, sem, limiter,
+            cache=cache, cache_key=cache_key, log=progress.message
+        )
+
+        # Report failures straight away; successes are summarised at the end
+        if not response:
+            progress.message(f"[{idx}/{total_rooms}] ✗ Failed to create room: {name} (Location: {location_id})")
+
+        progress.advance()
+        return response
+
+    # Rooms are deliberately not batched per location: the rooms endpoint
+    # only accepts a single room per request, and throughput is bounded by
+    # the 15 req/s API limit rather than by connection setup, so a handful of
+    # keep-alive connections already saturates it (HTTP/2 would not help).
+    connector = aiohttp.TCPConnector(limit=15, ttl_dns_cache=300)
+    timeout = aiohttp.ClientTimeout(total=30)
+
+    async with aiohttp.ClientSession(
+        connector=connector,
+        timeout=timeout,
+        headers=get_headers(token)
+    ) as session:
+        # gather() returns results in submission order, matching pending_rooms
+        responses = await asyncio.gather(*[
+            create_one(idx, location_id, name, cache_key)
+            for idx, location_id, name, cache_key in pending_rooms
+        ])
+
+    progress.finish()
+    return responses
+
+
+def _parse_location_id(value: str) -> Optional[int]:
+    """
+    Parse a locationId value from the CSV.
 
+    Args:
+        value: Cell value with surrounding whitespace removed
 
-def create_rooms_from_csv(org_id: str, token: str, csv_filename: str) -> None:
+    Returns:
+        The location ID as an integer, or None if empty or not a number
+    """
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def create_rooms_from_csv(
+    org_id: str,
+    token: str,
+    csv_filename: str,
+    cache: Optional[ResponseCache] = None
+) -> None:
     """
     Create rooms from CSV file and update CSV with DEC values.
 
+    Rooms are created concurrently while respecting the API rate limit.
+
     Args:
         org_id: Organization ID
         token: Bearer token
         csv_filename: Name of the CSV file
+        cache: Optional ResponseCache to skip rooms created by earlier runs
     """
     # Read CSV file
-    rooms_data = read_csv_file(csv_filename)
-    if not rooms_data:
+    csv_data = read_csv_file(csv_filename)
+    if not csv_data:
         return
+    fieldnames, rooms_data = csv_data
 
     print(f"\nFound {len(rooms_data)} rooms to create.")
-    print("Creating rooms with rate limiting (10 requests/second)...\n")
+    print("Creating rooms concurrently with rate limiting (12 requests/second)...\n")
 
-    # Initialize rate limiter (10 requests/second to stay safely below 15 req/s limit)
-    rate_limiter = RateLimiter(requests_per_second=10.0)
-
-    results = []
+    results: List[Dict] = [{"success": False, "dec": None} for _ in rooms_data]
     success_count = 0
     failure_count = 0
     skipped_count = 0
-    
-    # Track progress timing
-    start_time = time.time()
-
-    # Create each room
-    for idx, room in enumerate(rooms_data, 1):
-        location_id = room.get("locationId", "").strip()
-        name = room.get("name", "").strip()
-        existing_dec = room.get("DEC", "").strip()
-
-        if not location_id or not name:
+    reused_count = 0
+
+    # Parse every row once up front; invalid values become None
+    location_ids: List[Optional[int]] = []
+    has_location_ids: List[bool] = []
+    for room in rooms_data:
+        raw_location_id = (room.get("locationId") or "").strip()
+        has_location_ids.append(bool(raw_location_id))
+        location_ids.append(_parse_location_id(raw_location_id))
+    names = [(room.get("name") or "").strip() or None for room in rooms_data]
+    existing_decs = [(room.get("DEC") or "").strip() for room in rooms_data]
+
+    # Rooms that still need to be created: (row index, location ID, name, cache key)
+    pending_rooms: List[Tuple[int, int, str, str]] = []
+
+    # Rows sharing a location and name are told apart by their position among
+    # the duplicates, so each gets its own cache entry. A cached DEC that is
+    # already in the CSV or reused for another row is never handed out again.
+    occurrences: Dict[Tuple[Optional[int], str], int] = {}
+    used_decs = {dec for dec in existing_decs if dec}
+
+    rows = zip(location_ids, has_location_ids, names, existing_decs)
+    for idx, (location_id, has_location_id, name, existing_dec) in enumerate(rows, 1):
+        if not has_location_id or name is None:
             print(f"[{idx}/{len(rooms_data)}] Skipping row with missing data")
-            results.append({"success": False, "dec": None})
             failure_count += 1
             continue
-        
+
+        occurrence = occurrences.get((location_id, name), 0)
+        occurrences[(location_id, name)] = occurrence + 1
+
         # Skip if room already has a DEC value
         if existing_dec:
-            print(f"[{idx}/{len(rooms_data)}] Skipping room: {name} (already exists with DEC: {existing_dec})")
-            results.append({"success": True, "dec": existing_dec})
+            results[idx - 1] = {"success": True, "dec": existing_dec}
             skipped_count += 1
             success_count += 1  # Count as success since room exists
             continue
 
-        print(f"[{idx}/{len(rooms_data)}] Creating room: {name} (Location: {location_id})")
+        # Report bad location IDs before any API call is made
+        if location_id is None:
+            raw_location_id = rooms_data[idx - 1]["locationId"]
+            print(f"[{idx}/{len(rooms_data)}] Skipping room: {name} (invalid location ID '{raw_location_id}' - must be a number)")
+            failure_count += 1
+            continue
+
+        # Reuse the response if this room was created by an earlier run
+        cache_key = ResponseCache.make_key(org_id, location_id, name, occurrence)
+        if cache:
+            try:
+                cached_response = cache.get(cache_key)
+            except sqlite3.Error as e:
+                print(f"Warning: Could not read the room response cache ({e}); continuing without it.")
+                cache = None
+                cached_response = None
+            cached_dec = cached_response.get("dec", "") if cached_response else ""
+            if cached_response is not None and cached_dec not in used_decs:
+                results[idx - 1] = {"success": True, "dec": cached_dec}
+                if cached_dec:
+                    used_decs.add(cached_dec)
+                reused_count += 1
+                success_count += 1
+                continue
 
-        # Use the new create_room_with_retry function with rate limiting
-        response = create_room_with_retry(org_id, token, location_id, name, rate_limiter=rate_limiter)
+        pending_rooms.append((idx, location_id, name, cache_key))
 
-        if response:
-            dec = response.get("dec", "")
-            if not dec:
-                print(f"  ✓ Success (WARNING: No DEC in response)")
-                print(f"  API Response keys: {list(response.keys())}")
-            else:
-                print(f"  ✓ Success (DEC: {dec})")
-            results.append({"success": True, "dec": dec})
-            success_count += 1
-        else:
-            results.append({"success": False, "dec": None})
-            failure_count += 1
-        
-        # Display progress indicators after each room
-        elapsed_time = time.time() - start_time
-        rooms_processed = idx
-        
-        # Calculate rate and ETA
-        if elapsed_time > 0:
-            rate_per_minute = (rooms_processed / elapsed_time) * 60
-            remaining_rooms = len(rooms_data) - rooms_processed
-            
-            if rate_per_minute > 0:
-                eta_seconds = (remaining_rooms / rate_per_minute) * 60
-                eta_minutes = int(eta_seconds // 60)
-                eta_secs = int(eta_seconds % 60)
-                
-                # Format ETA
-                if eta_minutes > 0:
-                    eta_str = f"{eta_minutes}m {eta_secs}s"
+    if skipped_count:
+        print(f"Skipping {skipped_count} rooms that already have a DEC value.")
+    if reused_count:
+        print(f"Reusing {reused_count} rooms created by an earlier run (from {CACHE_FILENAME}; use --clear-cache if they were deleted).")
+
+    # Create the remaining rooms concurrently
+    if pending_rooms:
+        responses = asyncio.run(_create_rooms_async(org_id, token, pending_rooms, len(rooms_data), cache))
+        if cache:
+            try:
+                cache.flush()
+            except sqlite3.Error as e:
+                print(f"Warning: Could not save the room response cache: {e}")
+
+        created_lines = []
+        for (idx, _, name, _), response in zip(pending_rooms, responses):
+            if response:
+                dec = response.get("dec", "")
+                if not dec:
+                    created_lines.append(f"[{idx}/{len(rooms_data)}] ✓ Created room: {name} (WARNING: No DEC in response)")
+                    created_lines.append(f"  API Response keys: {list(response.keys())}")
                 else:
-                    eta_str = f"{eta_secs}s"
+                    created_lines.append(f"[{idx}/{len(rooms_data)}] ✓ Created room: {name} (DEC: {dec})")
+                results[idx - 1] = {"success": True, "dec": dec}
+                success_count += 1
             else:
-                eta_str = "calculating..."
-        else:
-            rate_per_minute = 0
-            eta_str = "calculating..."
-        
-        # Calculate percentage
-        percentage = (rooms_processed / len(rooms_data)) * 100
-        
-        # Display progress line
-        print(f"  Progress: {rooms_processed}/{len(rooms_data)} ({percentage:.1f}%) | "
-              f"Elapsed: {int(elapsed_time)}s | "
-              f"ETA: {eta_str}")
+                failure_count += 1
 
+        if created_lines:
+            print("\nCreated rooms:")
+            print("\n".join(created_lines))
 
     # Update CSV with DEC values
     if success_count > 0:
-        update_csv_with_dec(csv_filename, rooms_data, results)
+        update_csv_with_dec(csv_filename, fieldnames, rooms_data, results)
 
     # Summary
     print("\n" + "="*80)
     print("SUMMARY")
     print("="*80)
-    newly_created = success_count - skipped_count
+    newly_created = success_count - skipped_count - reused_count
     print(f"Newly created: {newly_created}")
+    print(f"Reused from cache: {reused_count}")
     print(f"Skipped (already existed): {skipped_count}")
     print(f"Failed: {failure_count}")
     print(f"Total: {len(rooms_data)}")
@@ -737,56 +1233,73 @@ def create_rooms_from_csv(org_id: str, token: str, csv_filename: str) -> None:
         print(f"\nCSV file '{csv_filename}' has been updated with DEC values.")
 
 
-def update_csv_with_dec(csv_filename: str, rooms_data: List[Dict], results: List[Dict]) -> None:
+def update_csv_with_dec(
+    csv_filename: str,
+    fieldnames: List[str],
+    rooms_data: List[Dict],
+    results: List[Dict]
+) -> None:
     """
     Update CSV file to add DEC column with values from API responses.
 
+    The rows are updated in place and written to a temporary file in the same
+    directory, which then replaces the original. A failure part-way through
+    therefore leaves the original CSV untouched.
+
     Args:
         csv_filename: Name of the CSV file
-        rooms_data: Original room data from CSV
+        fieldnames: Column names as read from the CSV
+        rooms_data: Original room data from CSV (DEC values are set in place)
         results: List of results with DEC values
     """
     csv_path = Path(csv_filename)
 
     print(f"\nUpdating CSV file '{csv_filename}' with DEC values...")
 
+    # Add DEC column if not present
+    fieldnames = list(fieldnames)
+    if "DEC" not in fieldnames:
+        fieldnames.append("DEC")
+        print(f"  Added 'DEC' column to CSV")
+
+    temp_path = None
     try:
-        # Read original fieldnames
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            fieldnames = list(reader.fieldnames)
-
-        # Add DEC column if not present
-        if "DEC" not in fieldnames:
-            fieldnames.append("DEC")
-            print(f"  Added 'DEC' column to CSV")
-
-        # Prepare updated data
-        updated_data = []
-        dec_count = 0
-        for room, result in zip(rooms_data, results):
-            updated_room = room.copy()
-            dec_value = result.get("dec", "") if result.get("success") else ""
-            updated_room["DEC"] = dec_value
-            if dec_value:
-                dec_count += 1
-            updated_data.append(updated_room)
-
-        print(f"  Prepared {len(updated_data)} rows with {dec_count} DEC values")
-
-        # Write updated CSV
-        with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+        with tempfile.NamedTemporaryFile(
+            'w', encoding='utf-8', newline='', dir=csv_path.absolute().parent,
+            prefix=f".{csv_path.name}.", suffix=".tmp", delete=False
+        ) as f:
+            temp_path = f.name
             writer = csv.DictWriter(f, fieldnames=fieldnames)
             writer.writeheader()
-            writer.writerows(updated_data)
 
+            dec_count = 0
+            for room, result in zip(rooms_data, results):
+                dec_value = result.get("dec", "") if result.get("success") else ""
+                room["DEC"] = dec_value
+                if dec_value:
+                    dec_count += 1
+                writer.writerow(room)
+
+        # Keep the original file's permissions (temporary files are private)
+        shutil.copymode(csv_path, temp_path)
+        os.replace(temp_path, csv_path)
+        temp_path = None
+
+        print(f"  Wrote {len(rooms_data)} rows with {dec_count} DEC values")
         print(f"  Successfully wrote updated CSV to {csv_path.absolute()}")
 
     except Exception as e:
         print(f"\nWarning: Could not update CSV file: {e}")
-        import traceback
         traceback.print_exc()
 
+    finally:
+        # Clean up the temporary file if it was not moved into place
+        if temp_path:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
 
 def list_csv_files() -> List[str]:
     """
@@ -825,8 +1338,31 @@ def display_menu() -> str:
         print("Invalid choice. Please enter 1-6.")
 
 
+def parse_args() -> argparse.Namespace:
+    """
+    Parse command-line arguments.
+
+    Returns:
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="A command-line tool for interacting with the Neat Pulse API.")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"don't read or write the room response cache ({CACHE_FILENAME})"
+    )
+    parser.add_argument(
+        "--clear-cache",
+        action="store_true",
+        help="clear the room response cache before starting"
+    )
+    return parser.parse_args()
+
+
 def main():
     """Main entry point for the tool."""
+    args = parse_args()
+
     print("="*80)
     print("NEAT PULSE API TOOL")
     print("="*80)
@@ -839,61 +1375,90 @@ def main():
 
     print(f"Loaded configuration for organization: {org_id}")
 
-    # Main loop
-    while True:
-        choice = display_menu()
-
-        if choice == "1":
-            list_regions(org_id, token)
-
-        elif choice == "2":
-            create_region(org_id, token)
+    # Authenticate every request made through the shared session
+    _authorize_session(token)
 
-        elif choice == "3":
-            list_locations(org_id, token)
-
-        elif choice == "4":
-            create_location(org_id, token)
-
-        elif choice == "5":
-            csv_files = list_csv_files()
-
-            if not csv_files:
-                print("\nNo CSV files found in the current directory.")
-                continue
-
-            print(f"\nAvailable CSV files:")
-            for idx, filename in enumerate(csv_files, 1):
-                print(f"  {idx}. {filename}")
-
-            print(f"  {len(csv_files) + 1}. Enter custom filename")
-            print(f"  {len(csv_files) + 2}. Cancel")
+    # Open the response cache of previously created rooms
+    cache = None
+    if not args.no_cache:
+        try:
+            cache = ResponseCache()
+            if args.clear_cache:
+                cache.clear()
+                print("Cleared the room response cache.")
+        except sqlite3.Error as e:
+            print(f"Warning: Could not open the room response cache ({CACHE_FILENAME}): {e}")
+            print("Continuing without the cache.")
+            if cache:
+                cache.close()
+            cache = None
+    elif args.clear_cache and Path(CACHE_FILENAME).exists():
+        Path(CACHE_FILENAME).unlink()
+        print("Cleared the room response cache.")
 
-            while True:
-                try:
-                    selection = input(f"\nSelect a file (1-{len(csv_files) + 2}): ").strip()
-                    selection_num = int(selection)
-
-                    if 1 <= selection_num <= len(csv_files):
-                        csv_filename = csv_files[selection_num - 1]
-                        break
-                    elif selection_num == len(csv_files) + 1:
-                        csv_filename = input("Enter CSV filename: ").strip()
-                        break
-                    elif selection_num == len(csv_files) + 2:
-                        csv_filename = None
-                        break
-                    else:
-                        print(f"Invalid selection. Please enter a number between 1 and {len(csv_files) + 2}.")
-                except ValueError:
-                    print("Invalid input. Please enter a number.")
-
-            if csv_filename:
-                create_rooms_from_csv(org_id, token, csv_filename)
-
-        elif choice == "6":
-            print("\nExiting. Goodbye!")
-            break
+    try:
+        # Main loop
+        while True:
+            choice = display_menu()
+
+            if choice == "1":
+                list_regions(org_id, token)
+
+            elif choice == "2":
+                create_region(org_id, token)
+
+            elif choice == "3":
+                list_locations(org_id, token)
+
+            elif choice == "4":
+                create_location(org_id, token)
+
+            elif choice == "5":
+                csv_files = list_csv_files()
+
+                if not csv_files:
+                    print("\nNo CSV files found in the current directory.")
+                    continue
+
+                print(f"\nAvailable CSV files:")
+                for idx, filename in enumerate(csv_files, 1):
+                    print(f"  {idx}. {filename}")
+
+                print(f"  {len(csv_files) + 1}. Enter custom filename")
+                print(f"  {len(csv_files) + 2}. Cancel")
+
+                while True:
+                    try:
+                        selection = input(f"\nSelect a file (1-{len(csv_files) + 2}): ").strip()
+                        selection_num = int(selection)
+
+                        if 1 <= selection_num <= len(csv_files):
+                            csv_filename = csv_files[selection_num - 1]
+                            break
+                        elif selection_num == len(csv_files) + 1:
+                            csv_filename = input("Enter CSV filename: ").strip()
+                            break
+                        elif selection_num == len(csv_files) + 2:
+                            csv_filename = None
+                            break
+                        else:
+                            print(f"Invalid selection. Please enter a number between 1 and {len(csv_files) + 2}.")
+                    except ValueError:
+                        print("Invalid input. Please enter a number.")
+
+                if csv_filename:
+                    create_rooms_from_csv(org_id, token, csv_filename, cache=cache)
+
+            elif choice == "6":
+                print("\nExiting. Goodbye!")
+                break
+    finally:
+        _session.close()
+        if cache:
+            try:
+                cache.close()
+            except sqlite3.Error as e:
+                print(f"Warning: Could not save the room response cache: {e}")
 
 
 if __name__ == "__main__":